@@ -1,10 +1,32 @@
 thonimport argparse
+import asyncio
+import dataclasses
+import importlib.util
 import json
 import logging
+import operator
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict
 
-from utils.cookie_validator import CookieValidator
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - only needed for --streaming-input
+    ijson = None
+
+from utils.cookie_validator import CookieValidator, ValidationResult
 from utils.session_manager import (
     AuthenticationError,
     SessionManager,
@@ -15,95 +37,447 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 DEFAULT_INPUT_PATH = BASE_DIR / "data" / "inputs.sample.json"
 DEFAULT_OUTPUT_PATH = BASE_DIR / "data" / "output_example.json"
 SESSION_CACHE_PATH = BASE_DIR / "data" / "session_cache.json"
+DEFAULT_CACHE_TTL = 60
+
+# Every field may be missing or null; consumers already treat null like absent.
+class CacheEntry(TypedDict, total=False):
+    headers: Optional[Dict[str, str]]
+    cookies: Optional[Dict[str, str]]
+    cached_at: Optional[float]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+# With msgspec each cache entry is decoded against a known schema (into plain
+# dicts, so the rest of the pipeline is unchanged); otherwise fall back to _loads.
+# Entries are decoded one at a time, so a bad entry only costs that one account.
+# msgspec also drops entries whose fields have the wrong type; the fallback keeps
+# them, and _is_fresh() treats a malformed timestamp as stale.
+if msgspec is not None:
+    _CACHE_DECODER = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+    _CACHE_ENTRY_DECODER = msgspec.json.Decoder(CacheEntry)
+    _CACHE_ENCODER = msgspec.json.Encoder()
+
+def _loads(raw: bytes) -> Any:
+    # orjson parses bytes directly; the stdlib fallback accepts bytes as well.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _encode_default(obj: Any) -> Any:
+    # orjson serializes dataclasses natively; mirror that for the stdlib fallback.
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(data: Any, indent: bool = True) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(
+        data,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        default=_encode_default,
+    ).encode("utf-8")
 
 def load_json(path: Path) -> Any:
     if not path.exists():
         raise FileNotFoundError(f"JSON file not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    with path.open("rb") as f:
+        return _loads(f.read())
+
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
+    # Skip the rewrite entirely when nothing changed; otherwise write a sibling
+    # temp file and swap it in so a crash never leaves a torn file behind.
+    if path.exists() and path.read_bytes() == payload:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
 
 def save_json(path: Path, data: Any) -> None:
+    _write_bytes_atomic(path, _dumps(data))
+
+def save_ndjson(path: Path, records: Iterable[Any]) -> None:
+    # Records are streamed to the same sibling temp file _write_bytes_atomic uses,
+    # so a crash mid-write leaves the previous output intact.
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as f:
+        for record in records:
+            f.write(_dumps(record, indent=False))
+            f.write(b"\n")
+    os.replace(tmp_path, path)
+
+class CredentialsError(ValueError):
+    """Raised (after logging) when the credentials file contains an invalid entry."""
 
-def load_session_cache() -> Dict[str, Dict[str, Dict[str, str]]]:
+class _LoginFailed(Exception):
+    """Raised by a worker once a failed login for ``email`` has been logged."""
+
+_get_email_password = operator.itemgetter("email", "password")
+
+def _parse_credential(idx: int, item: Any) -> Tuple[str, str]:
+    if not isinstance(item, dict):
+        logging.error("Invalid credential entry at index %d; expected object.", idx)
+        raise CredentialsError(f"Invalid credential entry at index {idx}.")
+    try:
+        email, password = _get_email_password(item)
+    except KeyError:
+        email = password = None
+    if not email or not password:
+        logging.error("Missing email or password in credential entry at index %d.", idx)
+        raise CredentialsError(f"Missing email or password at index {idx}.")
+    return email, password
+
+def load_credentials(path: Path) -> List[Tuple[str, str]]:
+    raw_creds = load_json(path)
+    if not isinstance(raw_creds, list):
+        logging.error("Credentials file must contain a JSON list of objects.")
+        raise CredentialsError("Credentials file must contain a JSON list of objects.")
+
+    # Validate entries and pull out (email, password) pairs in a single pass.
+    return [_parse_credential(idx, item) for idx, item in enumerate(raw_creds)]
+
+def iter_credentials(path: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (email, password) pairs while the top-level JSON array is still being
+    parsed, so logins can start before a large file has been read in full.
+
+    Invalid entries are only detected when reached, i.e. after earlier
+    credentials may already have been processed.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"JSON file not found: {path}")
+    with path.open("rb") as f:
+        for idx, item in enumerate(ijson.items(f, "item")):
+            yield _parse_credential(idx, item)
+
+def load_session_cache() -> Dict[str, CacheEntry]:
     if not SESSION_CACHE_PATH.exists():
         return {}
     try:
-        with SESSION_CACHE_PATH.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
+        if msgspec is not None:
+            raw = _CACHE_DECODER.decode(SESSION_CACHE_PATH.read_bytes())
+        else:
+            raw = _loads(SESSION_CACHE_PATH.read_bytes())
         if not isinstance(raw, dict):
             logging.warning("Session cache file is malformed; starting with empty cache.")
             return {}
-        return raw
     except Exception as exc:  # noqa: BLE001
         logging.warning("Failed to read session cache (%s); starting with empty cache.", exc)
         return {}
 
-def save_session_cache(cache: Dict[str, Dict[str, Dict[str, str]]]) -> None:
+    cache: Dict[str, CacheEntry] = {}
+    for email, entry in raw.items():
+        if msgspec is not None:
+            try:
+                entry = _CACHE_ENTRY_DECODER.decode(entry)
+            except msgspec.ValidationError as exc:
+                entry = None
+                logging.warning("Dropping malformed cache entry for %s: %s", email, exc)
+        elif not isinstance(entry, dict):
+            entry = None
+            logging.warning("Dropping malformed cache entry for %s.", email)
+        if entry is not None:
+            cache[email] = entry
+    return cache
+
+def save_session_cache(cache: Dict[str, CacheEntry]) -> None:
     try:
-        save_json(SESSION_CACHE_PATH, cache)
+        if msgspec is not None:
+            _write_bytes_atomic(SESSION_CACHE_PATH, _CACHE_ENCODER.encode(cache))
+        else:
+            save_json(SESSION_CACHE_PATH, cache)
     except Exception as exc:  # noqa: BLE001
         logging.warning("Failed to save session cache: %s", exc)
 
+def _is_fresh(cache_entry: CacheEntry, cache_ttl: float, now: float) -> bool:
+    cached_at = cache_entry.get("cached_at")
+    if not isinstance(cached_at, (int, float)):
+        # Missing or malformed timestamps never count as fresh.
+        cached_at = 0.0
+    return bool(cache_entry.get("cookies")) and now - cached_at < cache_ttl
+
+_Outcome = Tuple[str, SessionResult, Optional[CacheEntry]]
+
+def _reuse_cached(
+    email: str,
+    cache_entry: CacheEntry,
+    validation: Optional[ValidationResult],
+) -> _Outcome:
+    headers = cache_entry.get("headers") or {}
+    cookies = cache_entry.get("cookies") or {}
+    result = SessionResult(headers=headers, cookies=cookies)
+    if validation is None:
+        return email, result, None
+
+    refreshed_entry: CacheEntry = {
+        **cache_entry,
+        "cached_at": time.time(),
+        "etag": validation.etag,
+        "last_modified": validation.last_modified,
+    }
+    return email, result, refreshed_entry
+
+def _logged_in(email: str, session_result: SessionResult) -> _Outcome:
+    new_entry: CacheEntry = {
+        "headers": session_result.headers,
+        "cookies": session_result.cookies,
+        "cached_at": time.time(),
+    }
+    return email, session_result, new_entry
+
+def _fresh_outcome(
+    email: str, cache_entry: CacheEntry, cache_ttl: float, now: float
+) -> Optional[_Outcome]:
+    # Sessions verified within the TTL are reused without a network check.
+    if _is_fresh(cache_entry, cache_ttl, now):
+        logging.info("Cached session for %s is fresh; reusing.", email)
+        return _reuse_cached(email, cache_entry, None)
+    logging.info("Found cached session for %s; validating...", email)
+    return None
+
+def _validation_kwargs(cache_entry: CacheEntry) -> Dict[str, Any]:
+    return {
+        "cookies": cache_entry.get("cookies") or {},
+        "headers": cache_entry.get("headers") or {},
+        "etag": cache_entry.get("etag"),
+        "last_modified": cache_entry.get("last_modified"),
+    }
+
+def _validated_outcome(
+    email: str, cache_entry: CacheEntry, validation: Optional[ValidationResult]
+) -> Optional[_Outcome]:
+    if validation is not None and validation.valid:
+        logging.info("Cached session for %s is valid; reusing.", email)
+        return _reuse_cached(email, cache_entry, validation)
+    logging.info("Cached session for %s is invalid; renewing.", email)
+    return None
+
+def _login_failed(email: str, exc: Exception) -> _LoginFailed:
+    if isinstance(exc, AuthenticationError):
+        logging.error("Authentication failed for %s: %s", email, exc)
+    else:
+        logging.error("Unexpected error during login for %s: %s", email, exc)
+    return _LoginFailed(email)
+
+def _process_one(
+    email: str,
+    password: str,
+    cache_entry: Optional[CacheEntry],
+    session_manager: SessionManager,
+    validator: Optional[CookieValidator],
+    cache_ttl: float,
+    now: float,
+) -> _Outcome:
+    """
+    Resolve a session for a single credential set.
+
+    Returns the email, the resulting session, and the cache entry to store for
+    that email (None when the cached entry was reused as-is). ``validator`` may
+    be None only when ``cache_entry`` is missing or fresh as of ``now``.
+    """
+    logging.info("Processing credentials for email: %s", email)
+
+    if cache_entry:
+        outcome = _fresh_outcome(email, cache_entry, cache_ttl, now)
+        if outcome is None:
+            validation = None
+            if validator is not None:
+                validation = validator.check(**_validation_kwargs(cache_entry))
+            outcome = _validated_outcome(email, cache_entry, validation)
+        if outcome is not None:
+            return outcome
+
+    try:
+        session_result = session_manager.login(email=email, password=password)
+    except Exception as exc:  # noqa: BLE001
+        raise _login_failed(email, exc) from exc
+
+    return _logged_in(email, session_result)
+
+async def _process_one_async(
+    email: str,
+    password: str,
+    cache_entry: Optional[CacheEntry],
+    session_manager: SessionManager,
+    validator: Optional[CookieValidator],
+    cache_ttl: float,
+    now: float,
+) -> _Outcome:
+    """Coroutine counterpart of _process_one() for the HTTP/2 path."""
+    logging.info("Processing credentials for email: %s", email)
+
+    if cache_entry:
+        outcome = _fresh_outcome(email, cache_entry, cache_ttl, now)
+        if outcome is None:
+            validation = None
+            if validator is not None:
+                validation = await validator.check_async(**_validation_kwargs(cache_entry))
+            outcome = _validated_outcome(email, cache_entry, validation)
+        if outcome is not None:
+            return outcome
+
+    try:
+        session_result = await session_manager.login_async(email=email, password=password)
+    except Exception as exc:  # noqa: BLE001
+        raise _login_failed(email, exc) from exc
+
+    return _logged_in(email, session_result)
+
+_Task = Tuple[str, str, Optional[CacheEntry], Optional[CookieValidator]]
+
+# Upper bound on logins in flight at once, for both the thread pool and asyncio.
+_MAX_WORKERS = 32
+
+def _run_threaded(
+    tasks: Iterable[_Task],
+    session_manager: SessionManager,
+    cache_ttl: float,
+    now: float,
+) -> List[_Outcome]:
+    # Each credential is dominated by network round-trips, so fan them out over a
+    # thread pool, submitting work as soon as each credential is available.
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        futures: List[Future] = []
+        try:
+            for email, password, cache_entry, validator in tasks:
+                futures.append(
+                    executor.submit(
+                        _process_one,
+                        email,
+                        password,
+                        cache_entry,
+                        session_manager,
+                        validator,
+                        cache_ttl,
+                        now,
+                    )
+                )
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Fail fast like the sequential loop did: drop every credential that
+            # has not started yet instead of logging them all in first.
+            for future in futures:
+                future.cancel()
+            raise
+    return [future.result() for future in futures]
+
+async def _run_async(
+    tasks: Iterable[_Task],
+    session_manager: SessionManager,
+    cache_ttl: float,
+    now: float,
+) -> List[_Outcome]:
+    validator: Optional[CookieValidator] = None
+    pending = []
+    slots = asyncio.Semaphore(_MAX_WORKERS)
+    failed = []
+
+    def release(task: "asyncio.Task[_Outcome]") -> None:
+        slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            failed.append(task)
+
+    try:
+        for email, password, cache_entry, task_validator in tasks:
+            # Like the thread pool, keep at most _MAX_WORKERS logins in flight, and
+            # stop starting new ones once any has failed.
+            await slots.acquire()
+            if failed:
+                break
+            validator = task_validator or validator
+            task = asyncio.create_task(
+                _process_one_async(
+                    email,
+                    password,
+                    cache_entry,
+                    session_manager,
+                    task_validator,
+                    cache_ttl,
+                    now,
+                )
+            )
+            task.add_done_callback(release)
+            pending.append(task)
+            # Let the new task start while the rest of the input is still read.
+            await asyncio.sleep(0)
+        return await asyncio.gather(*pending)
+    except BaseException:
+        # Fail fast, and make sure no sibling task outlives the event loop.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
+    finally:
+        await session_manager.aclose()
+        if validator is not None:
+            await validator.aclose()
+
 def process_credentials(
-    credentials: List[Dict[str, str]],
+    credentials: Iterable[Tuple[str, str]],
     login_url: str,
     protected_url: str,
     timeout: int,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    use_http2: bool = False,
 ) -> List[SessionResult]:
     session_manager = SessionManager(
         base_login_url=login_url,
         protected_url=protected_url,
         timeout=timeout,
     )
-    validator = CookieValidator(
-        protected_url=protected_url,
-        timeout=timeout,
-    )
 
     cache = load_session_cache()
-    results: List[SessionResult] = []
-
-    for cred in credentials:
-        email = cred.get("email")
-        password = cred.get("password")
+    now = time.time()
+    validator: Optional[CookieValidator] = None
+    # Input order of emails, duplicates included; each email is processed once.
+    order: List[str] = []
 
-        if not email or not password:
-            logging.error("Missing email or password in credentials: %s", cred)
-            raise SystemExit(1)
-
-        logging.info("Processing credentials for email: %s", email)
+    def tasks() -> Iterator[_Task]:
+        # Consumed on this thread as credentials arrive. Only build a validator
+        # once some cached session is too old to reuse blindly; on a cold cache
+        # (or when every hit is fresh) the run is login/reuse only.
+        nonlocal validator
+        seen = set()
+        for count, (email, password) in enumerate(credentials, start=1):
+            order.append(email)
+            if email in seen:
+                logging.info("Duplicate credentials for %s; reusing its session.", email)
+                continue
+            seen.add(email)
 
-        cached = cache.get(email)
-        if cached:
-            logging.info("Found cached session for %s; validating...", email)
-            headers = cached.get("headers") or {}
-            cookies = cached.get("cookies") or {}
+            cache_entry = cache.get(email)
+            if cache_entry and validator is None and not _is_fresh(cache_entry, cache_ttl, now):
+                validator = CookieValidator(
+                    protected_url=protected_url,
+                    timeout=timeout,
+                )
+            logging.debug("Queued credential set #%d (%s)", count, email)
+            yield email, password, cache_entry, validator
 
-            if validator.is_valid(cookies=cookies, headers=headers):
-                logging.info("Cached session for %s is valid; reusing.", email)
-                results.append(SessionResult(headers=headers, cookies=cookies))
-                continue
-            else:
-                logging.info("Cached session for %s is invalid; renewing.", email)
+    # Workers only raise ordinary exceptions; SystemExit is raised here, outside
+    # the thread pool and the event loop.
+    try:
+        if use_http2:
+            outcomes = asyncio.run(_run_async(tasks(), session_manager, cache_ttl, now))
+        else:
+            outcomes = _run_threaded(tasks(), session_manager, cache_ttl, now)
+    except _LoginFailed as exc:
+        raise SystemExit(1) from exc
 
-        try:
-            session_result = session_manager.login(email=email, password=password)
-        except AuthenticationError as exc:
-            logging.error("Authentication failed for %s: %s", email, exc)
-            raise SystemExit(1) from exc
-        except Exception as exc:  # noqa: BLE001
-            logging.error("Unexpected error during login for %s: %s", email, exc)
-            raise SystemExit(1) from exc
-
-        cache[email] = {
-            "headers": session_result.headers,
-            "cookies": session_result.cookies,
-        }
-        results.append(session_result)
+    # The cache and results are only touched from this thread. Results are fanned
+    # back out so duplicates keep their position in the input.
+    by_email: Dict[str, SessionResult] = {}
+    for email, session_result, new_entry in outcomes:
+        if new_entry is not None:
+            cache[email] = new_entry
+        by_email[email] = session_result
+    results = [by_email[email] for email in order]
 
+    logging.info("Processed %d credential set(s).", len(results))
     save_session_cache(cache)
     return results
 
@@ -126,12 +500,25 @@ def parse_args() -> argparse.Namespace:
             f"Default: {DEFAULT_INPUT_PATH}"
         ),
     )
+    parser.add_argument(
+        "--streaming-input",
+        action="store_true",
+        help=(
+            "Parse the credentials file incrementally and start processing entries "
+            "as they are read. Useful for very large files; requires ijson."
+        ),
+    )
     parser.add_argument(
         "--output-file",
         type=str,
         default=str(DEFAULT_OUTPUT_PATH),
         help=f"Path where the resulting session objects will be written. Default: {DEFAULT_OUTPUT_PATH}",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write one JSON session object per line instead of a single JSON array.",
+    )
     parser.add_argument(
         "--login-url",
         type=str,
@@ -150,6 +537,23 @@ def parse_args() -> argparse.Namespace:
         default=15,
         help="Network timeout in seconds for HTTP requests. Default: 15",
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=(
+            "Seconds a cached session is reused without re-validating it against "
+            f"the protected URL. Use 0 to always validate. Default: {DEFAULT_CACHE_TTL}"
+        ),
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help=(
+            "Use httpx over HTTP/2 with asyncio instead of requests with a thread "
+            "pool. Requires httpx[http2]."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -164,50 +568,66 @@ def configure_logging(level: str) -> None:
         level=numeric_level,
         format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
     )
+    # The format above never uses thread, process or caller information, so skip
+    # collecting it (current_thread(), getpid(), frame walking) for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
 
 def main() -> None:
     args = parse_args()
     configure_logging(args.log_level)
 
+    if args.http2 and (
+        importlib.util.find_spec("httpx") is None or importlib.util.find_spec("h2") is None
+    ):
+        logging.error("--http2 requires httpx with HTTP/2 support: pip install 'httpx[http2]'")
+        raise SystemExit(1)
+
     credentials_path = Path(args.credentials_file)
     output_path = Path(args.output_file)
 
-    logging.info("Loading credentials from %s", credentials_path)
-    raw_creds = load_json(credentials_path)
-
-    if not isinstance(raw_creds, list):
-        logging.error("Credentials file must contain a JSON list of objects.")
+    if args.streaming_input and ijson is None:
+        logging.error("--streaming-input requires ijson: pip install ijson")
         raise SystemExit(1)
 
-    credentials: List[Dict[str, str]] = []
-    for idx, item in enumerate(raw_creds):
-        if not isinstance(item, dict):
-            logging.error("Invalid credential entry at index %d; expected object.", idx)
-            raise SystemExit(1)
-        credentials.append(item)
+    credentials: Iterable[Tuple[str, str]]
+    try:
+        if args.streaming_input:
+            logging.info("Streaming credentials from %s", credentials_path)
+            credentials = iter_credentials(credentials_path)
+        else:
+            logging.info("Loading credentials from %s", credentials_path)
+            credentials = load_credentials(credentials_path)
+            if not credentials:
+                logging.error("No credentials found in %s", credentials_path)
+                raise SystemExit(1)
+            logging.info("Processing %d credential set(s)...", len(credentials))
 
-    if not credentials:
+        session_results = process_credentials(
+            credentials=credentials,
+            login_url=args.login_url,
+            protected_url=args.protected_url,
+            timeout=args.timeout,
+            cache_ttl=args.cache_ttl,
+            use_http2=args.http2,
+        )
+    except CredentialsError as exc:
+        raise SystemExit(1) from exc
+
+    # Streamed input is only known to be empty once it has been consumed.
+    if not session_results:
         logging.error("No credentials found in %s", credentials_path)
         raise SystemExit(1)
 
-    logging.info("Processing %d credential set(s)...", len(credentials))
-    session_results = process_credentials(
-        credentials=credentials,
-        login_url=args.login_url,
-        protected_url=args.protected_url,
-        timeout=args.timeout,
-    )
-
-    serializable = [
-        {
-            "headers": result.headers,
-            "cookies": result.cookies,
-        }
-        for result in session_results
-    ]
-
-    logging.info("Writing %d session object(s) to %s", len(serializable), output_path)
-    save_json(output_path, serializable)
+    # SessionResult serializes directly to {"headers": ..., "cookies": ...}, so no
+    # intermediate copy of the results is built before writing.
+    logging.info("Writing %d session object(s) to %s", len(session_results), output_path)
+    if args.ndjson:
+        save_ndjson(output_path, session_results)
+    else:
+        save_json(output_path, session_results)
     logging.info("Done.")
 
 if __name__ == "__main__":
@@ -1,22 +1,76 @@
 thonimport logging
-from typing import Dict, Optional
+import threading
+import time
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
+from utils.probe import probe, probe_async
+from utils.ssl_adapter import SSLContextAdapter
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional async/HTTP/2 support
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+@dataclass
+class ValidationResult:
+    valid: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+_MemoKey = Tuple[
+    Tuple[Tuple[str, str], ...],
+    Tuple[Tuple[str, str], ...],
+    Optional[str],
+    Optional[str],
+]
+
 class CookieValidator:
     """
     Validates whether a given set of cookies and optional headers still represent
     a valid authenticated Crunchbase session.
 
-    The validator performs a GET request to a protected endpoint and considers the
-    session valid if it receives a 200-level response.
+    The validator performs a HEAD request to a protected endpoint (falling back to
+    a streamed GET whose body is never read) and considers the session valid if
+    it receives a 200-level response. When the caller supplies the ETag or
+    Last-Modified value from a previous check, the request is made conditional
+    and a 304 Not Modified response also counts as valid.
+
+    Outcomes are memoized per (cookies, headers, ETag, Last-Modified) for
+    ``memo_ttl`` seconds, so duplicate credentials or shared cookie jars cost a
+    single request. At most ``memo_maxsize`` outcomes are kept; the least
+    recently used one is evicted first.
     """
 
-    def __init__(self, protected_url: str, timeout: int = 10) -> None:
+    def __init__(
+        self,
+        protected_url: str,
+        timeout: int = 10,
+        memo_ttl: float = 60.0,
+        memo_maxsize: int = 256,
+    ) -> None:
         self.protected_url = protected_url
         self.timeout = timeout
+        self.memo_ttl = memo_ttl
+        self.memo_maxsize = memo_maxsize
+        self._memo: Dict[_MemoKey, Tuple[float, ValidationResult]] = {}
+        self._memo_lock = threading.Lock()
+
+        # A single pooled session keeps TLS connections warm across validations.
+        # Cookies are passed per request, and the session jar refuses to store
+        # any Set-Cookie responses so no state leaks between accounts.
+        self._session = requests.Session()
+        self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._session.mount(
+            "https://", SSLContextAdapter(pool_connections=16, pool_maxsize=32)
+        )
+        # Created on first use by check_async().
+        self._async_client: Optional["httpx.AsyncClient"] = None
 
     def is_valid(
         self,
@@ -38,38 +92,209 @@ class CookieValidator:
         bool
             True if the cookies are considered valid, False otherwise.
         """
+        return self.check(cookies=cookies, headers=headers).valid
+
+    def check(
+        self,
+        cookies: Dict[str, str],
+        headers: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> ValidationResult:
+        """
+        Validate the cookies, optionally as a conditional request.
+
+        Parameters
+        ----------
+        cookies:
+            A mapping of cookie name to value.
+        headers:
+            Optional HTTP headers to send along with the request.
+        etag:
+            ETag returned by a previous check, sent as If-None-Match.
+        last_modified:
+            Last-Modified value returned by a previous check, sent as
+            If-Modified-Since.
+
+        Returns
+        -------
+        ValidationResult
+            Whether the cookies are valid, plus the ETag / Last-Modified values
+            to send on the next check.
+        """
         if not cookies:
             logger.debug("CookieValidator: No cookies provided; invalid by definition.")
-            return False
+            return ValidationResult(valid=False)
 
-        session = requests.Session()
-        session.cookies.update(cookies)
+        memo_key = self._memo_key(cookies, headers, etag, last_modified)
+        memoized = self._memo_get(memo_key)
+        if memoized is not None:
+            logger.debug("CookieValidator: Reusing memoized validation outcome.")
+            return memoized
+
+        request_headers = self._conditional_headers(headers, etag, last_modified)
 
         try:
             logger.debug(
                 "CookieValidator: Sending validation request to %s", self.protected_url
             )
-            response = session.get(
+            response = probe(
+                self._session,
                 self.protected_url,
-                headers=headers or {},
+                cookies=cookies,
+                headers=request_headers,
                 timeout=self.timeout,
-                allow_redirects=False,
             )
         except requests.RequestException as exc:
             logger.warning("Cookie validation failed due to network error: %s", exc)
-            return False
+            return ValidationResult(valid=False)
+
+        result = self._result_from_response(response, etag, last_modified)
+        self._memo_put(memo_key, result)
+        return result
+
+    def _memo_key(
+        self,
+        cookies: Dict[str, str],
+        headers: Optional[Dict[str, str]],
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> _MemoKey:
+        return (
+            tuple(sorted(cookies.items())),
+            tuple(sorted((headers or {}).items())),
+            etag,
+            last_modified,
+        )
+
+    def _memo_get(self, key: _MemoKey) -> Optional[ValidationResult]:
+        with self._memo_lock:
+            entry = self._memo.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._memo[key]
+                return None
+            # Move the hit to the end so eviction drops the least recently used key.
+            self._memo[key] = self._memo.pop(key)
+            return result
+
+    def _memo_put(self, key: _MemoKey, result: ValidationResult) -> None:
+        # Network errors never reach here, so only real server answers are kept.
+        if self.memo_ttl <= 0 or self.memo_maxsize <= 0:
+            return
+        with self._memo_lock:
+            self._memo.pop(key, None)
+            while len(self._memo) >= self.memo_maxsize:
+                # Hits are re-inserted, so the first key is the least recently used.
+                del self._memo[next(iter(self._memo))]
+            self._memo[key] = (time.monotonic() + self.memo_ttl, result)
 
+    def _conditional_headers(
+        self,
+        headers: Optional[Dict[str, str]],
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> Dict[str, str]:
+        request_headers = dict(headers or {})
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+        return request_headers
+
+    def _result_from_response(
+        self,
+        response: Any,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> ValidationResult:
         # Many authenticated pages redirect on missing or invalid auth (302/401/403).
-        # We treat 200..299 as valid.
-        if 200 <= response.status_code < 300:
+        # We treat 200..299 as valid, and 304 as "still valid" for conditional checks.
+        if 200 <= response.status_code < 300 or response.status_code == 304:
             logger.debug(
                 "CookieValidator: Validation succeeded with status code %s",
                 response.status_code,
             )
-            return True
+            return ValidationResult(
+                valid=True,
+                etag=response.headers.get("ETag") or etag,
+                last_modified=response.headers.get("Last-Modified") or last_modified,
+            )
 
         logger.info(
             "CookieValidator: Validation failed with status code %s",
             response.status_code,
         )
-        return False
\ No newline at end of file
+        return ValidationResult(valid=False)
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        if httpx is None:
+            raise RuntimeError("Async validation requires httpx; install httpx[http2].")
+        if self._async_client is None:
+            # Same isolation as the requests session: the jar never stores cookies.
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=32),
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            )
+        return self._async_client
+
+    async def is_valid_async(
+        self,
+        cookies: Dict[str, str],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """Coroutine counterpart of is_valid()."""
+        return (await self.check_async(cookies=cookies, headers=headers)).valid
+
+    async def check_async(
+        self,
+        cookies: Dict[str, str],
+        headers: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> ValidationResult:
+        """
+        Coroutine counterpart of check(), built on httpx with HTTP/2.
+
+        Concurrent checks are multiplexed over a single connection. Call aclose()
+        once all checks are done.
+        """
+        if not cookies:
+            logger.debug("CookieValidator: No cookies provided; invalid by definition.")
+            return ValidationResult(valid=False)
+
+        memo_key = self._memo_key(cookies, headers, etag, last_modified)
+        memoized = self._memo_get(memo_key)
+        if memoized is not None:
+            logger.debug("CookieValidator: Reusing memoized validation outcome.")
+            return memoized
+
+        client = self._get_async_client()
+        request_headers = self._conditional_headers(headers, etag, last_modified)
+        # httpx discourages per-request cookies, so send them as a header instead.
+        request_headers["Cookie"] = "; ".join(
+            f"{name}={value}" for name, value in cookies.items()
+        )
+
+        try:
+            logger.debug(
+                "CookieValidator: Sending validation request to %s", self.protected_url
+            )
+            response = await probe_async(client, self.protected_url, headers=request_headers)
+        except httpx.HTTPError as exc:
+            logger.warning("Cookie validation failed due to network error: %s", exc)
+            return ValidationResult(valid=False)
+
+        result = self._result_from_response(response, etag, last_modified)
+        self._memo_put(memo_key, result)
+        return result
+
+    async def aclose(self) -> None:
+        """Close the async client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
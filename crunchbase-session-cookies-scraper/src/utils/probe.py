@@ -0,0 +1,42 @@
+thonimport logging
+from typing import Any
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Status codes a server uses to say it does not implement HEAD for a resource.
+HEAD_UNSUPPORTED_STATUSES = (405, 501)
+
+def probe(session: requests.Session, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Request ``url`` with HEAD, falling back to a streamed GET on 405/501.
+
+    Only the status code and headers of the returned response are meant to be
+    used; a fallback GET is closed before its body is read. Extra keyword
+    arguments are passed to both requests.
+    """
+    response = session.head(url, allow_redirects=False, **kwargs)
+    if response.status_code in HEAD_UNSUPPORTED_STATUSES:
+        logger.debug(
+            "HEAD not supported on %s (status %s); retrying with GET",
+            url,
+            response.status_code,
+        )
+        response = session.get(url, allow_redirects=False, stream=True, **kwargs)
+        # Only the status code matters; release the connection unread.
+        response.close()
+    return response
+
+async def probe_async(client: Any, url: str, **kwargs: Any) -> Any:
+    """Coroutine counterpart of probe() for an ``httpx.AsyncClient``."""
+    response = await client.head(url, **kwargs)
+    if response.status_code in HEAD_UNSUPPORTED_STATUSES:
+        logger.debug(
+            "HEAD not supported on %s (status %s); retrying with GET",
+            url,
+            response.status_code,
+        )
+        async with client.stream("GET", url, **kwargs) as response:
+            pass
+    return response
@@ -1,17 +1,50 @@
 thonimport json
 import logging
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 import requests
 
+from utils.probe import probe, probe_async
+from utils.ssl_adapter import SSLContextAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional async/HTTP/2 support
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+# A realistic browser-like user agent and generic headers, shared by every login.
+_BASE_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/124.0.0.0 Safari/537.36"
+        ),
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Origin": "https://www.crunchbase.com",
+        "Referer": "https://www.crunchbase.com/login",
+    }
+)
+
 class AuthenticationError(Exception):
     """Raised when Crunchbase authentication fails."""
 
 @dataclass
 class SessionResult:
+    # Declared by hand rather than via dataclass(slots=True) to stay importable
+    # on Python versions before 3.10.
+    __slots__ = ("headers", "cookies")
+
     headers: Dict[str, str]
     cookies: Dict[str, str]
 
@@ -35,22 +68,16 @@ class SessionManager:
         self.base_login_url = base_login_url
         self.protected_url = protected_url
         self.timeout = timeout
+        # Each login gets its own session (and cookie jar), but they all share
+        # this adapter so TCP/TLS connections are pooled across logins.
+        self._adapter = SSLContextAdapter(pool_connections=16, pool_maxsize=32)
+        # Created on first use by login_async(); shared by every async login.
+        self._async_transport: Optional["httpx.AsyncHTTPTransport"] = None
 
-    def _build_base_headers(self) -> Dict[str, str]:
-        # A realistic browser-like user agent and generic headers.
-        return {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/124.0.0.0 Safari/537.36"
-            ),
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Origin": "https://www.crunchbase.com",
-            "Referer": "https://www.crunchbase.com/login",
-        }
+    def _build_base_headers(self) -> Mapping[str, str]:
+        return _BASE_HEADERS
 
-    def _extract_token_from_response(self, response: requests.Response) -> str:
+    def _extract_token_from_response(self, response: Any) -> str:
         """
         Attempt to extract an authorization token from the login response.
 
@@ -58,7 +85,8 @@ class SessionManager:
         few reasonable patterns and fail gracefully with AuthenticationError.
         """
         try:
-            payload = response.json()
+            # orjson parses the raw body bytes, skipping the text decode step.
+            payload = orjson.loads(response.content) if orjson else response.json()
         except json.JSONDecodeError as exc:  # noqa: BLE001
             logger.debug("Login response is not JSON: %s", exc)
             raise AuthenticationError("Login response is not JSON; cannot extract token.")
@@ -72,6 +100,37 @@ class SessionManager:
 
         return str(token)
 
+    def _auth_headers_from_response(self, email: str, response: Any) -> Dict[str, str]:
+        """
+        Check the login response status and build the authenticated headers.
+
+        Works with both ``requests`` and ``httpx`` responses.
+        """
+        if response.status_code not in (200, 201):
+            logger.error(
+                "Login failed for %s with status %s", email, response.status_code
+            )
+            raise AuthenticationError(
+                f"Login failed with status code {response.status_code}."
+            )
+
+        # Try to extract token if available.
+        token = ""
+        try:
+            token = self._extract_token_from_response(response)
+        except AuthenticationError as exc:
+            # If no token is present but cookies exist, we can still proceed.
+            logger.warning("Token extraction issue: %s", exc)
+
+        # Merge base headers and auth header (if token exists). Either branch makes
+        # exactly one dict: the shared read-only mapping cannot be handed out as-is
+        # because SessionResult.headers must stay JSON-serializable and mutable.
+        headers = self._build_base_headers()
+        auth_headers = (
+            {**headers, "Authorization": f"Bearer {token}"} if token else dict(headers)
+        )
+        return auth_headers
+
     def login(self, email: str, password: str) -> SessionResult:
         """
         Perform login using the provided credentials and return a SessionResult.
@@ -94,6 +153,7 @@ class SessionManager:
             If login fails for any reason (invalid credentials, unexpected response).
         """
         session = requests.Session()
+        session.mount("https://", self._adapter)
         headers = self._build_base_headers()
 
         payload = {
@@ -113,26 +173,7 @@ class SessionManager:
             logger.error("Network error while logging in: %s", exc)
             raise AuthenticationError("Network error while logging in.") from exc
 
-        if response.status_code not in (200, 201):
-            logger.error(
-                "Login failed for %s with status %s", email, response.status_code
-            )
-            raise AuthenticationError(
-                f"Login failed with status code {response.status_code}."
-            )
-
-        # Try to extract token if available.
-        token = ""
-        try:
-            token = self._extract_token_from_response(response)
-        except AuthenticationError as exc:
-            # If no token is present but cookies exist, we can still proceed.
-            logger.warning("Token extraction issue: %s", exc)
-
-        # Merge base headers and auth header (if token exists).
-        auth_headers = dict(headers)
-        if token:
-            auth_headers["Authorization"] = f"Bearer {token}"
+        auth_headers = self._auth_headers_from_response(email=email, response=response)
 
         # Grab cookies after login.
         cookies_dict = session.cookies.get_dict()
@@ -165,22 +206,99 @@ class SessionManager:
             logger.debug(
                 "Verifying authenticated session by requesting %s", self.protected_url
             )
-            response = session.get(
-                self.protected_url,
-                headers=headers,
-                timeout=self.timeout,
-                allow_redirects=False,
+            response = probe(
+                session, self.protected_url, headers=headers, timeout=self.timeout
             )
         except requests.RequestException as exc:
             logger.error("Network error while verifying authenticated session: %s", exc)
             return False
 
-        if 200 <= response.status_code < 300:
-            logger.debug("Authenticated verification returned status %s", response.status_code)
+        return self._is_verified_status(response.status_code)
+
+    def _is_verified_status(self, status_code: int) -> bool:
+        if 200 <= status_code < 300:
+            logger.debug("Authenticated verification returned status %s", status_code)
             return True
 
         logger.warning(
             "Authenticated verification failed with status %s",
-            response.status_code,
+            status_code,
+        )
+        return False
+
+    def _get_async_transport(self) -> "httpx.AsyncHTTPTransport":
+        if httpx is None:
+            raise RuntimeError("Async logins require httpx; install httpx[http2].")
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        return self._async_transport
+
+    async def login_async(self, email: str, password: str) -> SessionResult:
+        """
+        Coroutine counterpart of login(), built on httpx with HTTP/2.
+
+        Every async login gets its own client (and cookie jar), but they all share
+        one HTTP/2 transport, so concurrent logins are multiplexed over the same
+        connection. Call aclose() once all logins are done.
+        """
+        client = httpx.AsyncClient(
+            transport=self._get_async_transport(),
+            timeout=self.timeout,
         )
-        return False
\ No newline at end of file
+        headers = self._build_base_headers()
+
+        payload = {
+            "email": email,
+            "password": password,
+        }
+
+        logger.info("Attempting login for %s", email)
+        try:
+            response = await client.post(
+                self.base_login_url,
+                headers=headers,
+                json=payload,
+                follow_redirects=True,
+            )
+        except httpx.HTTPError as exc:
+            logger.error("Network error while logging in: %s", exc)
+            raise AuthenticationError("Network error while logging in.") from exc
+
+        auth_headers = self._auth_headers_from_response(email=email, response=response)
+
+        cookies_dict = {cookie.name: cookie.value for cookie in client.cookies.jar}
+        if not cookies_dict:
+            logger.warning(
+                "Login response did not yield any cookies; this may indicate a failed login."
+            )
+
+        if not await self._verify_authenticated_async(client=client, headers=auth_headers):
+            raise AuthenticationError("Authenticated check failed after login.")
+
+        logger.info("Login and session verification succeeded for %s", email)
+        return SessionResult(headers=auth_headers, cookies=cookies_dict)
+
+    async def _verify_authenticated_async(
+        self,
+        client: "httpx.AsyncClient",
+        headers: Dict[str, str],
+    ) -> bool:
+        try:
+            logger.debug(
+                "Verifying authenticated session by requesting %s", self.protected_url
+            )
+            response = await probe_async(client, self.protected_url, headers=headers)
+        except httpx.HTTPError as exc:
+            logger.error("Network error while verifying authenticated session: %s", exc)
+            return False
+
+        return self._is_verified_status(response.status_code)
+
+    async def aclose(self) -> None:
+        """Close the shared async transport, if one was created."""
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+            self._async_transport = None
\ No newline at end of file
@@ -0,0 +1,37 @@
+import ssl
+from typing import Any, Dict, Tuple
+
+import requests.certs
+from requests.adapters import HTTPAdapter
+
+# Built once per process: loading the CA bundle is the expensive part of creating
+# an SSL context, so every default-verification pool shares this one.
+SSL_CONTEXT = ssl.create_default_context(cafile=requests.certs.where())
+
+class SSLContextAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose ``verify=True`` connection pools reuse SSL_CONTEXT.
+
+    Pools for ``verify=False`` or a CA bundle path (including one picked up from
+    REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE) are left to requests and urllib3, so a
+    custom bundle never touches the shared context. The hook only exists on
+    requests >= 2.32.3; older versions behave like a plain HTTPAdapter.
+    """
+
+    def build_connection_pool_key_attributes(
+        self, request: Any, verify: Any, cert: Any = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if verify is True:
+            pool_kwargs["ssl_context"] = SSL_CONTEXT
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True and getattr(conn, "conn_kw", {}).get("ssl_context") is SSL_CONTEXT:
+            # SSL_CONTEXT already trusts the default bundle; without this, urllib3
+            # would load it into the context again for every new connection.
+            conn.ca_certs = None
+            conn.ca_cert_dir = None